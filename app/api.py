@@ -1,11 +1,17 @@
 """HTTP endpoints for the Generic vs. Branded Medicine Finder."""
 from __future__ import annotations
 
-from http import HTTPStatus
-from typing import Any, Dict, List, Optional
+import hashlib
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import UTC, datetime
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, cast
 
-from flask import Flask, jsonify, render_template, request
+import orjson
+from flask import Flask, Response, render_template, request
 
+from .services.cache import LRUCache, SingleFlight, TTLCache
 from .services.education import EducationLibrary
 from .services.i18n import (
     build_metadata as build_i18n_metadata,
@@ -18,35 +24,115 @@ from .services.matching import MedicineMatcher
 from .services.pharmacy import PharmacyLocator, summarize_offers
 from .services.regulatory import RegulatoryDataFetcher, build_refresh_response
 
+# Plain ints rather than HTTPStatus members: the error branches (notably the
+# short-query 400 on typeahead search) are hit on most requests.
+_OK = 200
+_ACCEPTED = 202
+_BAD_REQUEST = 400
+_NOT_FOUND = 404
+_INTERNAL_SERVER_ERROR = 500
+
 matcher = MedicineMatcher()
 regulatory_fetcher = RegulatoryDataFetcher()
 pharmacy_locator = PharmacyLocator()
 education_library = EducationLibrary(matcher)
 
+# Fields exposed for every medicine result, in response order.
+_RESULT_KEYS = (
+    "brand_name",
+    "generic_name",
+    "form",
+    "strength",
+    "indications",
+    "average_brand_price",
+    "average_generic_price",
+    "savings",
+    "notes",
+    "sources",
+)
+
+# Translations are immutable at runtime, so per-language constants are built once.
+_SUPPORTED_LANGS = tuple(get_supported_languages())
+_ADVICE_BY_LANG: Dict[str, str] = {
+    language["code"]: translate("advice", language["code"]) for language in _SUPPORTED_LANGS
+}
+
+# Serialized language-dependent fields of the search response, without braces,
+# so each request only encodes its results and splices this suffix in.
+_ENVELOPE_BYTES: Dict[str, bytes] = {
+    code: orjson.dumps(
+        {"language": code, "advice": advice, "supported_languages": _SUPPORTED_LANGS}
+    )[1:-1]
+    for code, advice in _ADVICE_BY_LANG.items()
+}
+
+# Formatted payloads keyed by (brand, generic, locality); records never change once
+# loaded and refreshes only add new rows, so entries never go stale.
+_formatted_cache: LRUCache[Dict[str, Any]] = LRUCache(maxsize=4096)
+
+# Serialized bodies of successful per-medicine responses, keyed on the matcher
+# revision so a dataset refresh retires them.
+_response_cache: TTLCache[bytes] = TTLCache(maxsize=2048, ttl=60)
+
+# Rendered landing page (body, etag) keyed by (revision, language); only the
+# stats vary, so it is re-rendered after a dataset refresh.
+_index_pages: LRUCache[Tuple[bytes, str]] = LRUCache(maxsize=32)
+
+# Live regulatory refreshes run off the request thread; offline ones run inline.
+# The lock keeps merges into the shared matcher sequential either way.
+_refresh_lock = threading.Lock()
+_refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dataset-refresh")
+_refresh_jobs: LRUCache[Future] = LRUCache(maxsize=128)
+
+# Serialized education modules keyed by (revision, language); the featured
+# medicines depend on the catalog.
+_education_pages: LRUCache[Tuple[bytes, str]] = LRUCache(maxsize=32)
+
+# Typeahead traffic issues many identical searches at once; run each only once.
+_search_flight: SingleFlight[Tuple[bytes, str]] = SingleFlight(timeout=5)
+
+# Serialized search responses (body, etag) keyed by (revision, query, locality,
+# lang).
+_search_pages: LRUCache[Tuple[bytes, str]] = LRUCache(maxsize=2048)
+
+# Serialized medicine detail responses (body, etag) keyed like the other
+# per-medicine responses, plus the time the catalog last changed for
+# Last-Modified, which a dataset refresh that adds rows moves forward.
+_medicine_pages: LRUCache[Tuple[bytes, str]] = LRUCache(maxsize=2048)
+_catalog_modified = datetime.now(UTC).replace(microsecond=0)
+
 
 def _format_result(raw: Dict[str, Any], locality: Optional[str] = None) -> Dict[str, Any]:
-    # Optionally localize prices
-    if locality:
-        raw = matcher.adjust_prices(raw, locality)
-
-    brand_price = raw.get("average_brand_price")
-    generic_price = raw.get("average_generic_price")
-    savings = None
-    if isinstance(brand_price, (int, float)) and isinstance(generic_price, (int, float)):
-        savings = round(brand_price - generic_price, 2)
-
-    result = {
-        "brand_name": raw.get("brand_name"),
-        "generic_name": raw.get("generic_name"),
-        "form": raw.get("form"),
-        "strength": raw.get("strength"),
-        "indications": raw.get("indications", []),
-        "average_brand_price": brand_price,
-        "average_generic_price": generic_price,
-        "savings": savings,
-        "notes": raw.get("notes"),
-        "sources": raw.get("sources", []),
-    }
+    """Return the API representation of a medicine record.
+
+    The returned dict is shared between requests; copy it before mutating.
+    """
+    return _format_results((raw,), locality)[0]
+
+
+def _format_results(items: Iterable[Dict[str, Any]], locality: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Format a batch of medicine records, building only the uncached ones."""
+    records = list(items)
+    keys = [(raw.get("brand_name"), raw.get("generic_name"), locality) for raw in records]
+    cache_get = _formatted_cache.get
+    results = [cache_get(key) for key in keys]
+    missing = [index for index, formatted in enumerate(results) if formatted is None]
+    if missing:
+        fresh = [records[index] for index in missing]
+        if locality:
+            # Price every miss against a single multiplier lookup
+            fresh = matcher.adjust_prices_batch(fresh, locality)
+        for index, raw in zip(missing, fresh):
+            formatted = _build_result(raw, locality)
+            _formatted_cache.set(keys[index], formatted)
+            results[index] = formatted
+    return results  # type: ignore[return-value]
+
+
+def _build_result(raw: Dict[str, Any], locality: Optional[str] = None) -> Dict[str, Any]:
+    """Project an (already locality-adjusted) record onto the API fields."""
+    # Savings are computed when the record is loaded or its prices adjusted
+    result = {key: raw.get(key) for key in _RESULT_KEYS}
     if locality:
         # Include transparency about applied adjustment
         result["locality"] = locality
@@ -54,206 +140,357 @@ def _format_result(raw: Dict[str, Any], locality: Optional[str] = None) -> Dict[
     return result
 
 
+def _json(payload: Any, status: int = _OK) -> Response:
+    """Serialize ``payload`` with orjson into a JSON response."""
+    return Response(orjson.dumps(payload), status=status, mimetype="application/json")
+
+
+def _cached_json(key: Tuple[Any, ...]) -> Optional[Response]:
+    """Return a response for a previously cached body, if still fresh."""
+    body = _response_cache.get(key)
+    if body is None:
+        return None
+    return Response(body, mimetype="application/json")
+
+
+def _json_cached(key: Tuple[Any, ...], payload: Any) -> Response:
+    """Serialize ``payload``, remember the body under ``key`` and return it."""
+    body = orjson.dumps(payload)
+    _response_cache.set(key, body)
+    return Response(body, mimetype="application/json")
+
+
+def _etag(body: bytes) -> str:
+    return hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+def _conditional_response(
+    page: Tuple[bytes, str],
+    *,
+    mimetype: str = "application/json",
+    max_age: Optional[int] = None,
+    last_modified: Optional[datetime] = None,
+) -> Response:
+    """Return a pre-serialized ``(body, etag)`` page, honouring conditional headers."""
+    body, etag = page
+    response = Response(body, mimetype=mimetype)
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    if max_age is not None:
+        response.cache_control.public = True
+        response.cache_control.max_age = max_age
+    # make_conditional is typed on the werkzeug base class but returns self
+    return cast(Response, response.make_conditional(request))
+
+
+def _json_body() -> Dict[str, Any]:
+    """Parse a JSON request body as an object, or return {} when it is not one."""
+    if not request.is_json:
+        return {}
+    try:
+        body = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return {}
+    return body if isinstance(body, dict) else {}
+
+
 def _resolve_language_from_request() -> str:
     """Return a normalized language code derived from the current request."""
     return normalize_language_code(request.args.get("lang"))
 
 
-def _advice(lang: str) -> str:
-    return translate("advice", lang)
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
 
 
-def register_routes(app: Flask) -> None:
-    """Register HTTP routes on the provided Flask application."""
+class _QueryArgs(NamedTuple):
+    locality: Optional[str]
+    limit: int
+    include_alternatives: bool
+    lang: str
 
-    @app.get("/")
-    def index() -> str:
-        """Render the landing page."""
-        lang = _resolve_language_from_request()
-        stats = matcher.get_summary_stats()
-        return render_template(
+
+class _SavingsArgs(NamedTuple):
+    medicine: str
+    months: int
+    monthly_quantity: float
+
+
+def _coerce(value: Any, convert: Callable[[Any], Any], default: Any) -> Any:
+    """Return ``convert(value)``, or ``default`` when the value cannot be converted."""
+    try:
+        return convert(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _parse_query_args() -> _QueryArgs:
+    """Read the query parameters shared by the medicine endpoints in one pass."""
+    args = request.args
+    locality = (args.get("locality") or "").strip() or None
+    limit = _coerce(args.get("limit", 5), int, 5)
+    flag = args.get("include_alternatives") or ""
+    include_alternatives = flag in _TRUTHY or flag.strip().lower() in _TRUTHY
+    return _QueryArgs(locality, limit, include_alternatives, normalize_language_code(args.get("lang")))
+
+
+def _parse_savings_body() -> _SavingsArgs:
+    """Read the savings calculator fields, falling back to defaults for bad values."""
+    body = _json_body()
+    return _SavingsArgs(
+        str(body.get("medicine", "")).strip(),
+        _coerce(body.get("months", 12), int, 12),
+        _coerce(body.get("monthly_quantity", 1), float, 1.0),
+    )
+
+
+def _advice(lang: str) -> str:
+    return _ADVICE_BY_LANG[lang]
+
+
+def index() -> Response:
+    """Render the landing page."""
+    lang = _resolve_language_from_request()
+    key = (matcher.revision, lang)
+    page = _index_pages.get(key)
+    if page is None:
+        body = render_template(
             "index.html",
-            stats=stats,
+            stats=matcher.get_summary_stats(),
             lang=lang,
-            supported_languages=list(get_supported_languages()),
+            supported_languages=list(_SUPPORTED_LANGS),
+        ).encode("utf-8")
+        page = (body, _etag(body))
+        _index_pages.set(key, page)
+    return _conditional_response(page, mimetype="text/html", max_age=300)
+
+
+def search_medicines() -> Response:
+    """Search for branded or generic medicines."""
+    query = request.args.get("q", "").strip()
+    locality, _, _, lang = _parse_query_args()
+    if len(query) < 2:
+        return _json(
+            {
+                "error": translate("ui.feedback.enter_more", lang),
+                "advice": _advice(lang),
+                "language": lang,
+            },
+            _BAD_REQUEST,
         )
 
-    @app.get("/api/medicines")
-    def search_medicines() -> Any:
-        """Search for branded or generic medicines."""
-        query = request.args.get("q", "").strip()
-        locality = request.args.get("locality", "").strip() or None
-        lang = _resolve_language_from_request()
-        if len(query) < 2:
-            return (
-                jsonify(
-                    {
-                        "error": translate("ui.feedback.enter_more", lang),
-                        "advice": _advice(lang),
-                        "language": lang,
-                    }
-                ),
-                HTTPStatus.BAD_REQUEST,
-            )
-
+    key = (matcher.revision, query.lower(), locality, lang)
+    page = _search_pages.get(key)
+    if page is None:
         try:
-            results: List[Dict[str, Any]] = [_format_result(item, locality) for item in matcher.search(query)]
+            page = _search_flight.do(key, lambda: _build_search_page(query, locality, lang))
         except ValueError as exc:  # pragma: no cover - defensive, should not occur in normal usage
-            return jsonify({"error": str(exc), "advice": _advice(lang), "language": lang}), HTTPStatus.INTERNAL_SERVER_ERROR
+            return _json({"error": str(exc), "advice": _advice(lang), "language": lang}, _INTERNAL_SERVER_ERROR)
+        _search_pages.set(key, page)
+    return _conditional_response(page, max_age=60)
 
-        response_payload: Dict[str, Any] = {
-            "results": results,
-            "count": len(results),
-            "language": lang,
-            "advice": _advice(lang),
-            "supported_languages": list(get_supported_languages()),
-        }
-        if results:
-            response_payload["summary"] = matcher.get_summary_stats()
-            response_payload["locality"] = locality
-        return jsonify(response_payload)
-
-    @app.get("/api/medicines/<string:name>")
-    def get_medicine(name: str) -> Any:
-        """Return details for an exact branded or generic medicine match.
-
-        Optional query params:
-        - locality: adjust prices for a given locality code
-        - include_alternatives: if truthy, include a few alternatives in the payload
-        """
-        locality = request.args.get("locality", "").strip() or None
-        include_alternatives = request.args.get("include_alternatives", "").strip().lower() in {"1", "true", "yes"}
-        lang = _resolve_language_from_request()
-
-        result = matcher.find_by_brand_or_generic(name)
-        if not result:
-            return (
-                jsonify({
-                    "error": translate("ui.feedback.none", lang),
-                    "query": name,
-                    "language": lang,
-                    "advice": _advice(lang),
-                }),
-                HTTPStatus.NOT_FOUND,
-            )
-        formatted = _format_result(result, locality)
-
-        if include_alternatives:
-            alts = matcher.get_alternatives(result)
-            if locality:
-                alts = [_format_result(item, locality) for item in alts]
-            else:
-                alts = [_format_result(item) for item in alts]
-            formatted["alternatives"] = alts
-
-        formatted["language"] = lang
-        formatted["advice"] = _advice(lang)
-
-        return jsonify(formatted)
-
-    @app.get("/api/medicines/<string:name>/alternatives")
-    def get_alternatives(name: str) -> Any:
-        """Return alternative generic medicines based on shared indications.
-
-        Optional query params:
-        - locality: adjust prices for a given locality code
-        - limit: maximum number of alternatives to return (default 5)
-        """
-        base = matcher.find_by_brand_or_generic(name)
-        lang = _resolve_language_from_request()
-        if not base:
-            return (
-                jsonify({
-                    "error": translate("ui.feedback.none", lang),
-                    "query": name,
-                    "language": lang,
-                    "advice": _advice(lang),
-                }),
-                HTTPStatus.NOT_FOUND,
-            )
-        try:
-            limit = int(request.args.get("limit", 5))
-        except ValueError:
-            limit = 5
-        locality = request.args.get("locality", "").strip() or None
-        alts = matcher.get_alternatives(base, limit=limit)
-        if locality:
-            alts = [_format_result(item, locality) for item in alts]
-        else:
-            alts = [_format_result(item) for item in alts]
-        return jsonify(
+
+def _build_search_page(query: str, locality: Optional[str], lang: str) -> Tuple[bytes, str]:
+    results = _format_results(matcher.search(query), locality)
+    response_payload: Dict[str, Any] = {
+        "results": results,
+        "count": len(results),
+    }
+    if results:
+        response_payload["summary"] = matcher.get_summary_stats()
+        response_payload["locality"] = locality
+    body = orjson.dumps(response_payload)[:-1] + b"," + _ENVELOPE_BYTES[lang] + b"}"
+    return body, _etag(body)
+
+
+def get_medicine(name: str) -> Response:
+    """Return details for an exact branded or generic medicine match.
+
+    Optional query params:
+    - locality: adjust prices for a given locality code
+    - include_alternatives: if truthy, include a few alternatives in the payload
+    """
+    locality, _, include_alternatives, lang = _parse_query_args()
+    cache_key = (matcher.revision, name.lower(), locality, lang, include_alternatives)
+    page = _medicine_pages.get(cache_key)
+    if page is not None:
+        return _conditional_response(page, last_modified=_catalog_modified)
+
+    result = matcher.find_by_brand_or_generic(name)
+    if not result:
+        return _json(
             {
-                "base": _format_result(base, locality),
-                "alternatives": alts,
-                "count": len(alts),
+                "error": translate("ui.feedback.none", lang),
+                "query": name,
                 "language": lang,
                 "advice": _advice(lang),
-            }
+            },
+            _NOT_FOUND,
         )
+    formatted = dict(_format_result(result, locality))
 
-    @app.get("/api/medicines/<string:name>/pharmacies")
-    def get_pharmacies(name: str) -> Any:
-        """Surface nearby pharmacy or online offers for a medicine."""
-        lang = _resolve_language_from_request()
-        locality = request.args.get("locality", "").strip() or None
-        try:
-            limit = int(request.args.get("limit", 5))
-        except ValueError:
-            limit = 5
-        medicine = matcher.find_by_brand_or_generic(name)
-        if not medicine:
-            return (
-                jsonify({
-                    "error": translate("ui.feedback.none", lang),
-                    "query": name,
-                    "language": lang,
-                    "advice": _advice(lang),
-                }),
-                HTTPStatus.NOT_FOUND,
-            )
-
-        offers = pharmacy_locator.find_offers(medicine, locality=locality, limit=limit, lang=lang)
-        summary = summarize_offers(offers)
-        payload = {
-            "offers": offers,
-            "summary": summary,
-            "medicine": _format_result(medicine, locality),
+    if include_alternatives:
+        formatted["alternatives"] = _format_results(matcher.get_alternatives(result), locality)
+
+    formatted["language"] = lang
+    formatted["advice"] = _advice(lang)
+
+    body = orjson.dumps(formatted)
+    page = (body, _etag(body))
+    _medicine_pages.set(cache_key, page)
+    return _conditional_response(page, last_modified=_catalog_modified)
+
+
+def get_alternatives(name: str) -> Response:
+    """Return alternative generic medicines based on shared indications.
+
+    Optional query params:
+    - locality: adjust prices for a given locality code
+    - limit: maximum number of alternatives to return (default 5)
+    """
+    locality, limit, _, lang = _parse_query_args()
+    cache_key = ("alternatives", matcher.revision, name.lower(), locality, lang, limit)
+    cached = _cached_json(cache_key)
+    if cached is not None:
+        return cached
+
+    base = matcher.find_by_brand_or_generic(name)
+    if not base:
+        return _json(
+            {
+                "error": translate("ui.feedback.none", lang),
+                "query": name,
+                "language": lang,
+                "advice": _advice(lang),
+            },
+            _NOT_FOUND,
+        )
+    alts = _format_results(matcher.get_alternatives(base, limit=limit), locality)
+    return _json_cached(
+        cache_key,
+        {
+            "base": _format_result(base, locality),
+            "alternatives": alts,
+            "count": len(alts),
             "language": lang,
             "advice": _advice(lang),
         }
-        if locality:
-            payload["locality"] = locality
-        return jsonify(payload)
-
-    @app.post("/api/dataset/refresh")
-    def refresh_dataset() -> Any:
-        """Fetch and merge an enriched dataset from regulatory APIs."""
-        lang = _resolve_language_from_request()
-        body = request.get_json(silent=True) or {}
-        limit = int(body.get("limit", 40))
-        offline = body.get("offline")
-        offline = True if offline is None else bool(offline)
-
-        dataset, metadata = regulatory_fetcher.fetch_dataset(limit=limit, offline=offline)
+    )
+
+
+def get_pharmacies(name: str) -> Response:
+    """Surface nearby pharmacy or online offers for a medicine."""
+    locality, limit, _, lang = _parse_query_args()
+    cache_key = ("pharmacies", matcher.revision, name.lower(), locality, lang, limit)
+    cached = _cached_json(cache_key)
+    if cached is not None:
+        return cached
+
+    medicine = matcher.find_by_brand_or_generic(name)
+    if not medicine:
+        return _json(
+            {
+                "error": translate("ui.feedback.none", lang),
+                "query": name,
+                "language": lang,
+                "advice": _advice(lang),
+            },
+            _NOT_FOUND,
+        )
+
+    offers = pharmacy_locator.find_offers(medicine, locality=locality, limit=limit, lang=lang)
+    summary = summarize_offers(offers)
+    payload = {
+        "offers": offers,
+        "summary": summary,
+        "medicine": _format_result(medicine, locality),
+        "language": lang,
+        "advice": _advice(lang),
+    }
+    if locality:
+        payload["locality"] = locality
+    return _json_cached(cache_key, payload)
+
+
+def refresh_dataset() -> Response:
+    """Fetch and merge an enriched dataset from regulatory APIs.
+
+    Offline refreshes only read the packaged sample and complete inline. Live
+    refreshes call external APIs, so they run on a background worker and the
+    endpoint answers 202 with a job id to poll.
+    """
+    lang = _resolve_language_from_request()
+    body = _json_body()
+    limit = _coerce(body.get("limit", 40), int, 40)
+    offline = body.get("offline")
+    offline = True if offline is None else bool(offline)
+
+    if offline:
+        return _json(_run_refresh(limit, offline, lang))
+
+    job_id = uuid.uuid4().hex
+    _refresh_jobs.set(job_id, _refresh_executor.submit(_run_refresh, limit, offline, lang))
+    return _json(
+        {"job_id": job_id, "status": "pending", "language": lang, "advice": _advice(lang)},
+        _ACCEPTED,
+    )
+
+
+def get_refresh_status(job_id: str) -> Response:
+    """Report the state of a background dataset refresh."""
+    lang = _resolve_language_from_request()
+    job = _refresh_jobs.get(job_id)
+    if job is None:
+        return _json(
+            {
+                "error": translate("ui.feedback.unknown_job", lang),
+                "job_id": job_id,
+                "language": lang,
+                "advice": _advice(lang),
+            },
+            _NOT_FOUND,
+        )
+    payload: Dict[str, Any] = {"job_id": job_id, "language": lang, "advice": _advice(lang)}
+    if not job.done():
+        payload["status"] = "pending"
+    elif job.exception() is not None:
+        payload.update(status="failed", error=str(job.exception()))
+    else:
+        payload.update(status="completed", result=job.result())
+    return _json(payload)
+
+
+def _run_refresh(limit: int, offline: bool, lang: str) -> Dict[str, Any]:
+    global _catalog_modified
+    dataset, metadata = regulatory_fetcher.fetch_dataset(limit=limit, offline=offline)
+    # Response caches are keyed on matcher.revision, so merging is all it takes
+    # to retire them.
+    with _refresh_lock:
         added = matcher.extend_dataset(dataset)
+        if added:
+            _catalog_modified = datetime.now(UTC).replace(microsecond=0)
         stats = matcher.get_summary_stats()
-        metadata["merged_total"] = matcher.total_medicines
-        metadata["offline"] = offline
-        metadata["stats_snapshot"] = stats
-
-        response_payload = build_refresh_response(added=added, metadata=metadata, lang=lang)
-        response_payload.update({
-            "language": lang,
-            "stats": stats,
-        })
-        return jsonify(response_payload)
-
-    @app.get("/api/education/modules")
-    def get_education_modules() -> Any:
-        """Return educational modules tailored to chronic conditions."""
-        lang = _resolve_language_from_request()
+        merged_total = matcher.total_medicines
+    metadata["merged_total"] = merged_total
+    metadata["offline"] = offline
+    metadata["stats_snapshot"] = stats
+
+    response_payload = build_refresh_response(added=added, metadata=metadata, lang=lang)
+    response_payload.update({
+        "language": lang,
+        "stats": stats,
+    })
+    return response_payload
+
+
+def get_education_modules() -> Response:
+    """Return educational modules tailored to chronic conditions."""
+    lang = _resolve_language_from_request()
+    key = (matcher.revision, lang)
+    page = _education_pages.get(key)
+    if page is None:
         modules = education_library.get_modules(lang)
-        return jsonify(
+        body = orjson.dumps(
             {
                 "modules": modules,
                 "count": len(modules),
@@ -261,42 +498,58 @@ def register_routes(app: Flask) -> None:
                 "advice": _advice(lang),
             }
         )
+        page = (body, _etag(body))
+        _education_pages.set(key, page)
+    return _conditional_response(page, max_age=300)
 
-    @app.post("/api/education/savings")
-    def calculate_savings() -> Any:
-        """Estimate brand versus generic savings for chronic therapy."""
-        lang = _resolve_language_from_request()
-        body = request.get_json(silent=True) or {}
-        medicine_name = str(body.get("medicine", "")).strip()
-        try:
-            months = int(body.get("months", 12))
-        except (TypeError, ValueError):
-            months = 12
-        try:
-            monthly_quantity = float(body.get("monthly_quantity", 1))
-        except (TypeError, ValueError):
-            monthly_quantity = 1.0
 
-        try:
-            report = education_library.calculate_savings(
-                medicine_name,
-                months=months,
-                monthly_quantity=monthly_quantity,
-                lang=lang,
-            )
-        except ValueError as exc:
-            return (
-                jsonify({"error": str(exc), "language": lang, "advice": _advice(lang)}),
-                HTTPStatus.BAD_REQUEST,
-            )
-
-        report["language"] = lang
-        return jsonify(report)
-
-    @app.get("/api/i18n")
-    def get_i18n() -> Any:
-        """Expose translation dictionaries for the front-end."""
-        lang = _resolve_language_from_request()
-        metadata = build_i18n_metadata(lang)
-        metadata["advice"] = _advice(lang)
-        return jsonify({"languages": get_all_translations(), "metadata": metadata})
+def calculate_savings() -> Response:
+    """Estimate brand versus generic savings for chronic therapy."""
+    lang = _resolve_language_from_request()
+    medicine_name, months, monthly_quantity = _parse_savings_body()
+
+    try:
+        report = education_library.calculate_savings(
+            medicine_name,
+            months=months,
+            monthly_quantity=monthly_quantity,
+            lang=lang,
+        )
+    except ValueError as exc:
+        return _json({"error": str(exc), "language": lang, "advice": _advice(lang)}, _BAD_REQUEST)
+
+    report["language"] = lang
+    return _json(report)
+
+
+def get_i18n() -> Response:
+    """Expose translation dictionaries for the front-end."""
+    return _conditional_response(_I18N_PAGES[_resolve_language_from_request()], max_age=3600)
+
+
+def _build_i18n_page(lang: str) -> Tuple[bytes, str]:
+    metadata = build_i18n_metadata(lang)
+    metadata["advice"] = _ADVICE_BY_LANG[lang]
+    # orjson only serializes real dicts, not the read-only proxies
+    languages = {code: dict(strings) for code, strings in get_all_translations().items()}
+    body = orjson.dumps({"languages": languages, "metadata": metadata})
+    return body, _etag(body)
+
+
+# Translation tables never change at runtime, so each language's payload is
+# serialized once at import.
+_I18N_PAGES: Dict[str, Tuple[bytes, str]] = {code: _build_i18n_page(code) for code in _ADVICE_BY_LANG}
+
+
+def register_routes(app: Flask) -> None:
+    """Register HTTP routes on the provided Flask application."""
+    app.add_url_rule("/", view_func=index, methods=["GET"])
+    app.add_url_rule("/api/medicines", view_func=search_medicines, methods=["GET"])
+    app.add_url_rule("/api/medicines/<string:name>", view_func=get_medicine, methods=["GET"])
+    app.add_url_rule("/api/medicines/<string:name>/alternatives", view_func=get_alternatives, methods=["GET"])
+    app.add_url_rule("/api/medicines/<string:name>/pharmacies", view_func=get_pharmacies, methods=["GET"])
+    app.add_url_rule("/api/dataset/refresh", view_func=refresh_dataset, methods=["POST"])
+    app.add_url_rule("/api/dataset/refresh/<string:job_id>", view_func=get_refresh_status, methods=["GET"])
+    app.add_url_rule("/api/education/modules", view_func=get_education_modules, methods=["GET"])
+    app.add_url_rule("/api/education/savings", view_func=calculate_savings, methods=["POST"])
+    app.add_url_rule("/api/i18n", view_func=get_i18n, methods=["GET"])
@@ -0,0 +1,104 @@
+"""Small in-process caches shared by the API layer."""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class LRUCache(Generic[V]):
+    """Thread-safe bounded mapping that evicts the least recently used entry."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, V]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TTLCache(Generic[V]):
+    """LRU cache whose entries also expire ``ttl`` seconds after being stored."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0) -> None:
+        self.ttl = ttl
+        self._entries: LRUCache[Tuple[float, V]] = LRUCache(maxsize=maxsize)
+
+    def get(self, key: Hashable) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            return None
+        return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        self._entries.set(key, (time.monotonic() + self.ttl, value))
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SingleFlight(Generic[V]):
+    """Collapse concurrent calls that share a key into a single execution.
+
+    The first caller for a key runs ``fn``; callers arriving while it is still
+    running wait for and share its result (or exception). A waiter that is not
+    served within ``timeout`` seconds runs ``fn`` itself.
+    """
+
+    def __init__(self, timeout: Optional[float] = None) -> None:
+        self.timeout = timeout
+        self._inflight: Dict[Hashable, "Future[V]"] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], V]) -> V:
+        with self._lock:
+            pending = self._inflight.get(key)
+            if pending is None:
+                future: "Future[V]" = Future()
+                self._inflight[key] = future
+        if pending is not None:
+            try:
+                return pending.result(timeout=self.timeout)
+            except FutureTimeoutError:
+                return fn()
+
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
@@ -4,7 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, List
 
-from .i18n import normalize_language_code, translate
+from .i18n import get_supported_languages, make_translator, normalize_language_code, translate
 from .matching import MedicineMatcher
 
 
@@ -38,25 +38,34 @@ class EducationLibrary:
 
     def __init__(self, matcher: MedicineMatcher) -> None:
         self._matcher = matcher
+        # Every module's translated fields, resolved once per supported language
+        self._localized: Dict[str, List[Dict[str, object]]] = {
+            language["code"]: [self._localize(module, language["code"]) for module in self._MODULES]
+            for language in get_supported_languages()
+        }
+
+    @staticmethod
+    def _localize(module: ModuleConfig, normalized: str) -> Dict[str, object]:
+        t = make_translator(normalized)
+        tips = t(f"{module.key}.tips")
+        if not isinstance(tips, list):
+            tips = [tips]
+        return {
+            "key": module.key,
+            "conditions": module.conditions,
+            "title": t(f"{module.key}.title"),
+            "summary": t(f"{module.key}.summary"),
+            "tips": tips,
+        }
 
     def get_modules(self, lang: str | None = None) -> List[Dict[str, object]]:
+        """Return the modules for ``lang``; the translated fields are shared, do not mutate them."""
         normalized = normalize_language_code(lang)
-        modules: List[Dict[str, object]] = []
-        for module in self._MODULES:
-            tips = translate(f"{module.key}.tips", normalized)
-            if not isinstance(tips, list):
-                tips = [tips]
-            modules.append(
-                {
-                    "key": module.key,
-                    "conditions": module.conditions,
-                    "title": translate(f"{module.key}.title", normalized),
-                    "summary": translate(f"{module.key}.summary", normalized),
-                    "tips": tips,
-                    "featured_medicines": [med for med in module.featured_medicines if self._matcher.find_by_brand_or_generic(med)],
-                }
-            )
-        return modules
+        contains = self._matcher.contains
+        return [
+            {**localized, "featured_medicines": [med for med in module.featured_medicines if contains(med)]}
+            for module, localized in zip(self._MODULES, self._localized[normalized])
+        ]
 
     def calculate_savings(
         self,
@@ -71,12 +80,12 @@ class EducationLibrary:
         if months <= 0 or monthly_quantity <= 0:
             raise ValueError("Months and quantity must be positive values.")
 
-        medicine = self._matcher.find_by_brand_or_generic(medicine_name)
+        medicine = self._matcher.lookup(medicine_name)
         if not medicine:
             raise ValueError(translate("ui.feedback.none", lang))
 
-        brand_price = float(medicine.get("average_brand_price") or 0.0)
-        generic_price = float(medicine.get("average_generic_price") or 0.0)
+        brand_price = float(medicine.average_brand_price or 0.0)
+        generic_price = float(medicine.average_generic_price or 0.0)
         monthly_brand_cost = round(brand_price * monthly_quantity, 2)
         monthly_generic_cost = round(generic_price * monthly_quantity, 2)
         monthly_savings = round(monthly_brand_cost - monthly_generic_cost, 2)
@@ -84,8 +93,8 @@ class EducationLibrary:
 
         normalized = normalize_language_code(lang)
         return {
-            "medicine": medicine["brand_name"],
-            "generic": medicine["generic_name"],
+            "medicine": medicine.brand_name,
+            "generic": medicine.generic_name,
             "months": months,
             "monthly_quantity": monthly_quantity,
             "monthly_brand_cost": monthly_brand_cost,
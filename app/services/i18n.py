@@ -1,8 +1,11 @@
 """Lightweight internationalization helpers for the medicine finder experience."""
 from __future__ import annotations
 
+import sys
 from datetime import UTC, datetime
-from typing import Dict, Iterable, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, Mapping, Tuple
 
 
 _TRANSLATIONS: Dict[str, Dict[str, object]] = {
@@ -28,6 +31,7 @@ _TRANSLATIONS: Dict[str, Dict[str, object]] = {
             "ui.feedback.none": "No matches found. Try a different brand or generic name.",
             "ui.feedback.matches": "{count} matches found.",
             "ui.feedback.single_match": "1 match found.",
+            "ui.feedback.unknown_job": "Unknown refresh job.",
             "ui.results.disclaimer": "Pricing reflects average retail fills; verify with your pharmacist for patient-specific costs.",
             "ui.results.sources": "Sources",
             "ui.results.indications": "Indications",
@@ -98,6 +102,7 @@ _TRANSLATIONS: Dict[str, Dict[str, object]] = {
             "ui.feedback.none": "No se encontraron resultados. Pruebe con otro nombre comercial o genérico.",
             "ui.feedback.matches": "{count} resultados encontrados.",
             "ui.feedback.single_match": "1 resultado encontrado.",
+            "ui.feedback.unknown_job": "Trabajo de actualización desconocido.",
             "ui.results.disclaimer": "Los precios reflejan promedios minoristas; verifique con su farmacia para costos específicos.",
             "ui.results.sources": "Fuentes",
             "ui.results.indications": "Indicaciones",
@@ -168,6 +173,7 @@ _TRANSLATIONS: Dict[str, Dict[str, object]] = {
             "ui.feedback.none": "कोई परिणाम नहीं मिला। कोई दूसरा नाम आज़माएँ।",
             "ui.feedback.matches": "{count} परिणाम मिले।",
             "ui.feedback.single_match": "1 परिणाम मिला।",
+            "ui.feedback.unknown_job": "अज्ञात रीफ़्रेश कार्य।",
             "ui.results.disclaimer": "कीमतें औसत खुदरा मूल्य दर्शाती हैं; सटीक जानकारी के लिए अपने फार्मासिस्ट से जाँच करें।",
             "ui.results.sources": "स्रोत",
             "ui.results.indications": "प्रयोग",
@@ -218,9 +224,27 @@ _TRANSLATIONS: Dict[str, Dict[str, object]] = {
     },
 }
 
+# Flat per-language string tables, with English filled in for missing keys so a
+# translation is a single dict lookup. Keys and values are interned so strings
+# shared between languages are stored once.
+_STRINGS: Dict[str, Dict[str, str]] = {
+    code: {
+        sys.intern(key): sys.intern(value) if isinstance(value, str) else value
+        for key, value in cfg["strings"].items()  # type: ignore[attr-defined]
+    }
+    for code, cfg in _TRANSLATIONS.items()
+}
+_MERGED: Dict[str, Dict[str, str]] = {
+    code: {**_STRINGS["en"], **strings} for code, strings in _STRINGS.items()
+}
 
+
+@lru_cache(maxsize=256)
 def normalize_language_code(language: str | None) -> str:
-    """Return a supported language code (defaults to English)."""
+    """Return a supported language code (defaults to English).
+
+    Memoized: the same handful of ``lang`` values repeat on nearly every request.
+    """
     if not language:
         return "en"
     code = language.lower()
@@ -234,37 +258,54 @@ def normalize_language_code(language: str | None) -> str:
 
 def translate(key: str, language: str | None = None) -> str:
     """Translate the given key, falling back to English when missing."""
-    normalized = normalize_language_code(language)
-    strings = _TRANSLATIONS[normalized]["strings"]  # type: ignore[index]
-    if key in strings:
-        return strings[key]  # type: ignore[return-value]
-    # fall back to English and finally the key itself
-    default_strings = _TRANSLATIONS["en"]["strings"]  # type: ignore[index]
-    return default_strings.get(key, key)  # type: ignore[return-value]
+    # falls back to English and finally the key itself
+    return _MERGED[normalize_language_code(language)].get(key, key)
+
+
+_SUPPORTED_LIST: Tuple[Dict[str, str], ...] = tuple(
+    {
+        "code": code,
+        "label": payload["label"],  # type: ignore[dict-item]
+        "direction": payload.get("direction", "ltr"),  # type: ignore[dict-item]
+    }
+    for code, payload in _TRANSLATIONS.items()
+)
+
+
+def make_translator(language: str | None = None) -> Callable[[str], str]:
+    """Return ``translate`` bound to one language, for callers resolving many keys."""
+    return _translator(normalize_language_code(language))
+
+
+@lru_cache(maxsize=None)
+def _translator(normalized: str) -> Callable[[str], str]:
+    lookup = _MERGED[normalized].get
+
+    def translate_key(key: str) -> str:
+        return lookup(key, key)
+
+    return translate_key
 
 
 def get_supported_languages() -> Iterable[Dict[str, str]]:
-    """Return the available languages for selection in the UI."""
-    return (
-        {
-            "code": code,
-            "label": payload["label"],
-            "direction": payload.get("direction", "ltr"),
-        }
-        for code, payload in _TRANSLATIONS.items()
-    )
+    """Return the available languages for selection in the UI (shared, do not mutate)."""
+    return _SUPPORTED_LIST
 
 
-def get_translations(language: str | None = None) -> Dict[str, str]:
-    """Return all translation strings for a single language."""
-    normalized = normalize_language_code(language)
-    strings = _TRANSLATIONS[normalized]["strings"]  # type: ignore[index]
-    return dict(strings)  # shallow copy to prevent mutation
+# Read-only views handed out instead of copying the string tables per call
+_READONLY: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {code: MappingProxyType(strings) for code, strings in _STRINGS.items()}
+)
+
+
+def get_translations(language: str | None = None) -> Mapping[str, str]:
+    """Return all translation strings for a single language (read-only)."""
+    return _READONLY[normalize_language_code(language)]
 
 
-def get_all_translations() -> Dict[str, Dict[str, str]]:
-    """Return translations for all supported languages."""
-    return {code: dict(cfg["strings"]) for code, cfg in _TRANSLATIONS.items()}
+def get_all_translations() -> Mapping[str, Mapping[str, str]]:
+    """Return translations for all supported languages (read-only)."""
+    return _READONLY
 
 
 def build_metadata(language: str | None = None) -> Dict[str, object]:
@@ -273,11 +314,11 @@ def build_metadata(language: str | None = None) -> Dict[str, object]:
     return {
         "language": normalized,
         "generated_at": datetime.now(UTC).isoformat(timespec="seconds").replace("+00:00", "Z"),
-        "supported": list(get_supported_languages()),
+        "supported": _SUPPORTED_LIST,
     }
 
 
-def require_language(language: str | None) -> Tuple[str, Dict[str, str]]:
+def require_language(language: str | None) -> Tuple[str, Mapping[str, str]]:
     """Return a normalized language code and its translation dictionary."""
     normalized = normalize_language_code(language)
     strings = get_translations(normalized)
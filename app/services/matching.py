@@ -1,13 +1,21 @@
 """Business logic for matching branded medicines with generic equivalents."""
 from __future__ import annotations
 
-import json
+import heapq
 import re
-from dataclasses import dataclass
+import sys
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from difflib import SequenceMatcher
-from functools import cached_property
-from importlib import resources
-from typing import Dict, Iterable, List, Optional, Tuple
+from functools import cached_property, lru_cache
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from .packaged import load_packaged_json
+
+
+# round(ratio, 2) can only reach 1.0 for a non-substring pair once the combined
+# length is 200+, so below that substring hits are the only 1.0 scores.
+_EXACT_TIE_LENGTH = 200
 
 
 @dataclass(slots=True)
@@ -17,18 +25,22 @@ class Medicine:
     indications: List[str]
     form: str
     strength: str
-    average_brand_price: float
-    average_generic_price: float
+    average_brand_price: Optional[float]
+    average_generic_price: Optional[float]
     notes: Optional[str] = None
     sources: Optional[List[Dict[str, str]]] = None
+    savings: Optional[float] = field(init=False)
+    normalized_brand: str = field(init=False, repr=False)
+    normalized_generic: str = field(init=False, repr=False)
+    indications_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _as_dict: Optional[Dict[str, object]] = field(init=False, default=None, repr=False, compare=False)
 
-    @property
-    def normalized_brand(self) -> str:
-        return _normalize(self.brand_name)
-
-    @property
-    def normalized_generic(self) -> str:
-        return _normalize(self.generic_name)
+    def __post_init__(self) -> None:
+        self.savings = _savings(self.average_brand_price, self.average_generic_price)
+        # Interned: many rows share a generic, and these are the index keys
+        self.normalized_brand = sys.intern(_normalize(self.brand_name))
+        self.normalized_generic = sys.intern(_normalize(self.generic_name))
+        self.indications_set = frozenset(map(str, self.indications))
 
 
 class MedicineMatcher:
@@ -37,13 +49,57 @@ class MedicineMatcher:
     def __init__(self, dataset: Optional[Iterable[Dict[str, object]]] = None) -> None:
         if dataset is None:
             dataset = self._load_default_dataset()
-        self._medicines: List[Medicine] = [self._parse(row) for row in dataset if self._is_valid(row)]
+        self._medicines: List[Medicine] = []
+        # Bumped whenever the catalog changes so dependents can drop derived caches
+        self.revision = 0
+        self._by_brand: Dict[str, Medicine] = {}
+        self._by_generic: Dict[str, Medicine] = {}
+        # Normalized names parallel to _medicines, so the scoring loop walks two
+        # flat lists of strings instead of loading attributes off each row
+        self._normalized_brands: List[str] = []
+        self._normalized_generics: List[str] = []
+        self._haystack_parts: List[str] = []
+        self._haystack: Optional[str] = None
+        self._haystack_length = 0
+        self._row_starts: List[int] = []
+        self._longest_name = 0
+        # Running price totals over rows with both prices, for get_summary_stats
+        self._priced = 0
+        self._total_brand = 0.0
+        self._total_generic = 0.0
+        self._summary_stats: Optional[Dict[str, object]] = None
+        # Ranked row indices per (normalized query, limit, revision)
+        self._search_rows = lru_cache(maxsize=1024)(self._rank_rows)
+        for row in dataset:
+            if self._is_valid(row):
+                self._add(self._parse(row))
         if not self._medicines:
             raise ValueError("No medicines available in dataset")
 
+    def _add(self, medicine: Medicine) -> None:
+        self._medicines.append(medicine)
+        self._normalized_brands.append(medicine.normalized_brand)
+        self._normalized_generics.append(medicine.normalized_generic)
+        # Normalized names never contain "\n", so it safely separates entries
+        part = f"{medicine.normalized_brand}\n{medicine.normalized_generic}\n"
+        self._row_starts.append(self._haystack_length)
+        self._haystack_parts.append(part)
+        self._haystack_length += len(part)
+        self._haystack = None
+        self._longest_name = max(
+            self._longest_name, len(medicine.normalized_brand), len(medicine.normalized_generic)
+        )
+        if medicine.average_brand_price and medicine.average_generic_price:
+            self._priced += 1
+            self._total_brand += medicine.average_brand_price
+            self._total_generic += medicine.average_generic_price
+        self._summary_stats = None
+        # First occurrence wins, matching the original in-order scan
+        self._by_brand.setdefault(medicine.normalized_brand, medicine)
+        self._by_generic.setdefault(medicine.normalized_generic, medicine)
+
     def _load_default_dataset(self) -> Iterable[Dict[str, object]]:
-        with resources.files("app.data").joinpath("medicines.json").open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        return load_packaged_json("medicines.json")
 
     @staticmethod
     def _parse(row: Dict[str, object]) -> Medicine:
@@ -53,8 +109,8 @@ class MedicineMatcher:
             indications=list(row.get("indications", [])),
             form=str(row.get("form", "")),
             strength=str(row.get("strength", "")),
-            average_brand_price=float(row.get("average_brand_price", 0.0)),
-            average_generic_price=float(row.get("average_generic_price", 0.0)),
+            average_brand_price=_coerce_price(row.get("average_brand_price", 0.0)),
+            average_generic_price=_coerce_price(row.get("average_generic_price", 0.0)),
             notes=row.get("notes"),
             sources=row.get("sources"),
         )
@@ -64,53 +120,106 @@ class MedicineMatcher:
         return "brand_name" in row and "generic_name" in row
 
     def search(self, query: str, limit: int = 10) -> List[Dict[str, object]]:
-        """Return the top matches for the provided query."""
-        normalized_query = _normalize(query)
+        """Return the top matches for the provided query.
 
-        scored: List[tuple[float, Medicine]] = []
-        for medicine in self._medicines:
-            brand_score = _score(normalized_query, medicine.normalized_brand)
-            generic_score = _score(normalized_query, medicine.normalized_generic)
-            if brand_score == 0 and generic_score == 0:
+        Queries with fewer than two letters or digits match nothing.
+        """
+        normalized_query = _normalize(query)
+        if len(normalized_query) < 2:
+            return []
+        medicines = self._medicines
+        return [self._to_dict(medicines[row]) for row in self._search_rows(normalized_query, limit, self.revision)]
+
+    def _rank_rows(self, normalized_query: str, limit: int, revision: int) -> Tuple[int, ...]:
+        # ``revision`` only keys the memo so rankings from before a merge go unused.
+        # Substring hits score 1.0 and keep dataset order on ties, so when there
+        # are at least ``limit`` of them no fuzzy score can displace them.
+        if normalized_query and len(normalized_query) + self._longest_name < _EXACT_TIE_LENGTH:
+            exact = self._substring_rows(normalized_query, limit)
+            if len(exact) >= limit:
+                return tuple(exact)
+
+        if limit <= 0:
+            return ()
+        # Bounded min-heap of (score, -row): the root is the weakest kept hit, and
+        # later rows only displace it with a strictly higher score, which keeps
+        # dataset order on ties. ``floor`` lets the scorer skip hopeless rows.
+        score = _scorer(normalized_query)
+        heap: List[Tuple[float, int]] = []
+        floor = 0.0
+        for row, (brand, generic) in enumerate(zip(self._normalized_brands, self._normalized_generics)):
+            best = score(brand, floor)
+            if best < 1.0:
+                best = max(best, score(generic, max(floor, best)))
+            if best <= floor:
                 continue
-            scored.append((max(brand_score, generic_score), medicine))
-
-        scored.sort(key=lambda item: item[0], reverse=True)
-        return [self._to_dict(med) for _, med in scored[:limit]]
+            if len(heap) < limit:
+                heapq.heappush(heap, (best, -row))
+                if len(heap) == limit:
+                    floor = heap[0][0]
+            else:
+                heapq.heapreplace(heap, (best, -row))
+                floor = heap[0][0]
+
+        heap.sort(reverse=True)
+        return tuple(-negated_row for _, negated_row in heap)
+
+    def _substring_rows(self, normalized_query: str, limit: int) -> List[int]:
+        """Return up to ``limit`` row indices whose brand or generic contains the query.
+
+        Scans one newline-joined string of every normalized name with str.find,
+        keeping the per-row work in C.
+        """
+        # Read once: a concurrent merge resets the attribute to None
+        haystack = self._haystack
+        if haystack is None:
+            haystack = self._haystack = "".join(self._haystack_parts)
+        starts = self._row_starts
+        rows: List[int] = []
+        position = haystack.find(normalized_query)
+        while position != -1 and len(rows) < limit:
+            row = bisect_right(starts, position) - 1
+            rows.append(row)
+            if row + 1 >= len(starts):
+                break
+            position = haystack.find(normalized_query, starts[row + 1])
+        return rows
 
     def find_by_brand(self, brand_name: str) -> Optional[Dict[str, object]]:
-        normalized = _normalize(brand_name)
-        for medicine in self._medicines:
-            if medicine.normalized_brand == normalized:
-                return self._to_dict(medicine)
-        return None
+        medicine = self._by_brand.get(_normalize(brand_name))
+        return self._to_dict(medicine) if medicine else None
 
     def find_by_generic(self, generic_name: str) -> Optional[Dict[str, object]]:
         """Return details for an exact generic medicine match."""
-        normalized = _normalize(generic_name)
-        for medicine in self._medicines:
-            if medicine.normalized_generic == normalized:
-                return self._to_dict(medicine)
-        return None
+        medicine = self._by_generic.get(_normalize(generic_name))
+        return self._to_dict(medicine) if medicine else None
 
     def find_by_brand_or_generic(self, name: str) -> Optional[Dict[str, object]]:
         """Return details for an exact brand or generic match (normalized)."""
-        return self.find_by_brand(name) or self.find_by_generic(name)
+        medicine = self.lookup(name)
+        return self._to_dict(medicine) if medicine else None
+
+    def lookup(self, name: str) -> Optional[Medicine]:
+        """Return the Medicine for an exact brand or generic match, without copying it."""
+        normalized = _normalize(name)
+        return self._by_brand.get(normalized) or self._by_generic.get(normalized)
+
+    def contains(self, name: str) -> bool:
+        """Return True when ``name`` exactly matches a known brand or generic."""
+        return self.lookup(name) is not None
 
     def get_summary_stats(self) -> Dict[str, object]:
-        """Return simple stats for the landing page."""
-        prices = [
-            (med.average_brand_price, med.average_generic_price)
-            for med in self._medicines
-            if med.average_brand_price and med.average_generic_price
-        ]
-        if not prices:
+        """Return simple stats for the landing page; the dict is shared, do not mutate it."""
+        if self._summary_stats is None:
+            self._summary_stats = self._build_summary_stats()
+        return self._summary_stats
+
+    def _build_summary_stats(self) -> Dict[str, object]:
+        if not self._priced:
             return {"total_medicines": len(self._medicines)}
 
-        total_brand = sum(pair[0] for pair in prices)
-        total_generic = sum(pair[1] for pair in prices)
-        avg_brand = round(total_brand / len(prices), 2)
-        avg_generic = round(total_generic / len(prices), 2)
+        avg_brand = round(self._total_brand / self._priced, 2)
+        avg_generic = round(self._total_generic / self._priced, 2)
         avg_savings = round(avg_brand - avg_generic, 2)
 
         return {
@@ -134,9 +243,11 @@ class MedicineMatcher:
             key = (medicine.normalized_brand, medicine.normalized_generic)
             if key in existing:
                 continue
-            self._medicines.append(medicine)
+            self._add(medicine)
             existing.add(key)
             added += 1
+        if added:
+            self.revision += 1
         return added
 
     @property
@@ -168,16 +279,25 @@ class MedicineMatcher:
         We apply a multiplier per locality to both brand and generic averages.
         Unknown locality falls back to 'default' (no change).
         """
+        return self.adjust_prices_batch([raw], locality)[0]
+
+    def adjust_prices_batch(self, items: Iterable[Dict[str, object]], locality: str) -> List[Dict[str, object]]:
+        """Return locality-adjusted copies of ``items``, resolving the multiplier once."""
         multiplier = self._LOCALITY_ADJUSTMENTS.get(locality.lower(), self._LOCALITY_ADJUSTMENTS["default"])
-        adjusted = dict(raw)
-        b = adjusted.get("average_brand_price")
-        g = adjusted.get("average_generic_price")
-        if isinstance(b, (int, float)):
-            adjusted["average_brand_price"] = round(float(b) * multiplier, 2)
-        if isinstance(g, (int, float)):
-            adjusted["average_generic_price"] = round(float(g) * multiplier, 2)
-        adjusted["price_adjustment"] = {"locality": locality, "multiplier": multiplier}
-        return adjusted
+        adjustment = {"locality": locality, "multiplier": multiplier}
+        adjusted_items: List[Dict[str, object]] = []
+        for raw in items:
+            adjusted = dict(raw)
+            b = adjusted.get("average_brand_price")
+            g = adjusted.get("average_generic_price")
+            if isinstance(b, (int, float)):
+                adjusted["average_brand_price"] = b = round(float(b) * multiplier, 2)
+            if isinstance(g, (int, float)):
+                adjusted["average_generic_price"] = g = round(float(g) * multiplier, 2)
+            adjusted["savings"] = _savings(b, g)
+            adjusted["price_adjustment"] = adjustment
+            adjusted_items.append(adjusted)
+        return adjusted_items
 
     def get_alternatives(self, base: Dict[str, object], limit: int = 5) -> List[Dict[str, object]]:
         """Suggest alternative generic medicines based on shared indications.
@@ -188,22 +308,30 @@ class MedicineMatcher:
         - Prefer lower-cost generics by sorting on average_generic_price ascending.
         - Return up to `limit` items as dicts.
         """
-        base_inds = set(map(str, base.get("indications", [])))
+        base_inds = frozenset(map(str, base.get("indications", [])))
         base_generic = str(base.get("generic_name", ""))
         candidates: List[Tuple[float, Medicine]] = []
         for med in self._medicines:
             if med.generic_name == base_generic:
                 continue
-            if not base_inds or not set(med.indications).intersection(base_inds):
+            if not base_inds or med.indications_set.isdisjoint(base_inds):
                 continue
             price = med.average_generic_price or float("inf")
             candidates.append((price, med))
 
-        candidates.sort(key=lambda x: (x[0], x[1].brand_name))
-        return [self._to_dict(med) for _, med in candidates[:limit]]
+        cheapest = heapq.nsmallest(limit, candidates, key=lambda x: (x[0], x[1].brand_name))
+        return [self._to_dict(med) for _, med in cheapest]
 
     @staticmethod
     def _to_dict(medicine: Medicine) -> Dict[str, object]:
+        """Return the serializable view of ``medicine``; it is shared, do not mutate it."""
+        cached = medicine._as_dict
+        if cached is None:
+            cached = medicine._as_dict = MedicineMatcher._build_dict(medicine)
+        return cached
+
+    @staticmethod
+    def _build_dict(medicine: Medicine) -> Dict[str, object]:
         return {
             "brand_name": medicine.brand_name,
             "generic_name": medicine.generic_name,
@@ -212,6 +340,7 @@ class MedicineMatcher:
             "strength": medicine.strength,
             "average_brand_price": medicine.average_brand_price,
             "average_generic_price": medicine.average_generic_price,
+            "savings": medicine.savings,
             "notes": medicine.notes,
             "sources": medicine.sources or [],
         }
@@ -221,14 +350,61 @@ class MedicineMatcher:
         return [med.brand_name for med in self._medicines]
 
 
+# Deletes every ASCII character that is not a lowercase letter or digit
+_ASCII_STRIP = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not ("a" <= chr(c) <= "z" or "0" <= chr(c) <= "9"))
+)
+
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]")
+
+
+@lru_cache(maxsize=4096)
 def _normalize(value: str) -> str:
-    return re.sub(r"[^a-z0-9]", "", value.lower())
+    lowered = value.lower()
+    if lowered.isascii():
+        return lowered.translate(_ASCII_STRIP)
+    return _NON_ALNUM.sub("", lowered)
+
+
+def _coerce_price(value: object) -> Optional[float]:
+    """Return ``value`` as a float, or None when it is missing or not numeric."""
+    if value is None:
+        return None
+    try:
+        return float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
 
 
-def _score(query: str, target: str) -> float:
-    if not query or not target:
-        return 0.0
-    if query in target:
-        return 1.0
-    ratio = SequenceMatcher(None, query, target).ratio()
-    return round(ratio, 2)
+def _savings(brand_price: object, generic_price: object) -> Optional[float]:
+    if isinstance(brand_price, (int, float)) and isinstance(generic_price, (int, float)):
+        return round(brand_price - generic_price, 2)
+    return None
+
+
+def _scorer(query: str) -> Callable[[str, float], float]:
+    """Return a scoring function for ``query`` that reuses one SequenceMatcher.
+
+    Scores match the previous per-pair ``SequenceMatcher(None, query, target)``;
+    targets are swapped in with set_seq2 instead of building a matcher per row.
+    When the cheap upper bounds show a target cannot score above ``floor``, the
+    full ratio is skipped and 0.0 is returned instead.
+    """
+    sequence = SequenceMatcher(None, query)
+    query_chars = frozenset(query)
+
+    def score(target: str, floor: float = 0.0) -> float:
+        if not query or not target:
+            return 0.0
+        if query in target:
+            return 1.0
+        # No shared characters means no matching blocks, so the ratio is 0
+        if query_chars.isdisjoint(target):
+            return 0.0
+        sequence.set_seq2(target)
+        if round(sequence.real_quick_ratio(), 2) <= floor or round(sequence.quick_ratio(), 2) <= floor:
+            return 0.0
+        return round(sequence.ratio(), 2)
+
+    return score
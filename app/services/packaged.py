@@ -0,0 +1,14 @@
+"""Access to the JSON datasets shipped in ``app.data``."""
+from __future__ import annotations
+
+from functools import lru_cache
+from importlib import resources
+from typing import Dict, Tuple
+
+import orjson
+
+
+@lru_cache(maxsize=None)
+def load_packaged_json(name: str) -> Tuple[Dict[str, object], ...]:
+    """Parse a packaged dataset once per process; rows are shared, do not mutate them."""
+    return tuple(orjson.loads(resources.files("app.data").joinpath(name).read_bytes()))
@@ -79,6 +79,17 @@ class PharmacyLocator:
         },
     ]
 
+    def __init__(self) -> None:
+        # Prices scale with the multiplier, so ordering by it up front means the
+        # first ``limit`` offers of any bucket are the cheapest ones.
+        self._offers = sorted(self._OFFERS, key=lambda offer: float(offer.get("price_multiplier", 1.0)))
+        # Offers grouped by the locality's country segment ("us", "in", "online").
+        # A locality only matches offers from its own country.
+        self._offers_by_country: Dict[str, List[Dict[str, object]]] = {}
+        for offer in self._offers:
+            country = str(offer["locality"]).split("-")[0]
+            self._offers_by_country.setdefault(country, []).append(offer)
+
     def find_offers(
         self,
         medicine: Dict[str, object],
@@ -87,14 +98,16 @@ class PharmacyLocator:
         limit: int = 5,
         lang: str | None = None,
     ) -> List[Dict[str, object]]:
-        """Return ordered offers for a medicine and locality."""
+        """Return the cheapest ``limit`` offers for a medicine and locality, cheapest first."""
         if not medicine:
             return []
 
         normalized_locality = (locality or "").lower()
-        matches = [offer for offer in self._OFFERS if self._matches_locality(offer["locality"], normalized_locality)]
-        if not matches:
-            matches = [offer for offer in self._OFFERS if offer["locality"].startswith("online")]
+        if not normalized_locality:
+            matches = self._offers
+        else:
+            country = normalized_locality.split("-")[0]
+            matches = self._offers_by_country.get(country) or self._offers_by_country["online"]
 
         currency = self._currency_for_locality(normalized_locality)
         base_price = float(medicine.get("average_generic_price") or medicine.get("average_brand_price") or 0.0)
@@ -103,6 +116,7 @@ class PharmacyLocator:
 
         offers: List[Dict[str, object]] = []
         now = datetime.now(UTC)
+        advice = translate("advice", normalize_language_code(lang))
         for offer in matches[:limit]:
             multiplier = float(offer.get("price_multiplier", 1.0))
             price = round(base_price * multiplier, 2)
@@ -116,24 +130,14 @@ class PharmacyLocator:
                     "currency": currency,
                     "delivery": offer.get("delivery_eta"),
                     "url": offer.get("url"),
-                    "last_updated": (now - timedelta(minutes=offer.get("distance_km") or 0))
-                    .isoformat(timespec="minutes")
-                    .replace("+00:00", "Z"),
-                    "advice": translate("advice", normalize_language_code(lang)),
+                    "last_updated": (now - timedelta(minutes=offer.get("distance_km") or 0)).strftime(
+                        "%Y-%m-%dT%H:%MZ"
+                    ),
+                    "advice": advice,
                 }
             )
-        offers.sort(key=lambda item: item["price"])
         return offers
 
-    def _matches_locality(self, offer_locality: str, requested: str) -> bool:
-        if not requested:
-            return True
-        if offer_locality == requested:
-            return True
-        offer_country = offer_locality.split("-")[0]
-        req_country = requested.split("-")[0]
-        return offer_country == req_country
-
     def _currency_for_locality(self, locality: str) -> Dict[str, str]:
         if not locality:
             country = "us"
@@ -1,21 +1,24 @@
 """Integration helpers for regulatory drug datasets (FDA Orange Book, openFDA)."""
 from __future__ import annotations
 
-import json
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
-from importlib import resources
 from typing import Dict, List, Optional, Tuple
 
+import orjson
+
 from .i18n import translate
+from .packaged import load_packaged_json
+
+_OPENFDA_ENDPOINT = "https://api.fda.gov/drug/drugsfda.json?search=products.marketing_status:%22Prescription%22"
+_ORANGE_BOOK_ENDPOINT = "https://api.fda.gov/drug/ndc.json?search=finished:true"
+
 
-_OPENFDA_ENDPOINT = (
-    "https://api.fda.gov/drug/drugsfda.json?search=products.marketing_status:%22Prescription%22&limit={limit}"
-)
-_ORANGE_BOOK_ENDPOINT = (
-    "https://api.fda.gov/drug/ndc.json?search=finished:true&limit={limit}"
-)
+def _endpoint_url(endpoint: str, limit: int) -> str:
+    """Return ``endpoint`` with its page size clamped to openFDA's 1-100 range."""
+    return f"{endpoint}&limit={max(1, min(limit, 100))}"
 
 
 class RegulatoryDataFetcher:
@@ -23,6 +26,8 @@ class RegulatoryDataFetcher:
 
     def __init__(self, timeout: int = 8) -> None:
         self.timeout = timeout
+        # url -> (ETag, Last-Modified, parsed payload) for conditional re-fetches
+        self._http_cache: Dict[str, Tuple[Optional[str], Optional[str], Dict[str, object]]] = {}
 
     # --- Public API -----------------------------------------------------
     def fetch_dataset(
@@ -48,8 +53,13 @@ sample if the request fails or produces incomplete data.
         }
 
         if not offline:
-            dataset.extend(self._try_fetch_openfda(limit // 2))
-            dataset.extend(self._try_fetch_orange_book(limit // 2))
+            # The two GETs are independent, so run them concurrently; results are
+            # still merged openFDA first.
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix="openfda") as executor:
+                openfda = executor.submit(self._try_fetch_openfda, limit // 2)
+                orange_book = executor.submit(self._try_fetch_orange_book, limit // 2)
+                dataset.extend(openfda.result())
+                dataset.extend(orange_book.result())
             metadata["notes"].append(
                 "Live fetch attempted from openFDA and Orange Book APIs; offline sample used for any gaps."
             )
@@ -76,7 +86,7 @@ sample if the request fails or produces incomplete data.
 
     # --- Internal helpers -----------------------------------------------
     def _try_fetch_openfda(self, limit: int) -> List[Dict[str, object]]:
-        url = _OPENFDA_ENDPOINT.format(limit=max(1, min(limit, 100)))
+        url = _endpoint_url(_OPENFDA_ENDPOINT, limit)
         payload = self._safe_json_request(url)
         if not payload:
             return []
@@ -119,7 +129,7 @@ sample if the request fails or produces incomplete data.
         return results
 
     def _try_fetch_orange_book(self, limit: int) -> List[Dict[str, object]]:
-        url = _ORANGE_BOOK_ENDPOINT.format(limit=max(1, min(limit, 100)))
+        url = _endpoint_url(_ORANGE_BOOK_ENDPOINT, limit)
         payload = self._safe_json_request(url)
         if not payload:
             return []
@@ -153,21 +163,43 @@ sample if the request fails or produces incomplete data.
         return results
 
     def _load_sample(self) -> List[Dict[str, object]]:
-        with resources.files("app.data").joinpath("regulatory_sample.json").open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        return list(load_packaged_json("regulatory_sample.json"))
 
     def _safe_json_request(self, url: str) -> Optional[Dict[str, object]]:
+        """GET ``url`` as JSON, revalidating any earlier response with its validators.
+
+        A 304 Not Modified reuses the payload parsed last time.
+        """
+        cached = self._http_cache.get(url)
+        headers: Dict[str, str] = {}
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        request = urllib.request.Request(url, headers=headers)
         try:
-            with urllib.request.urlopen(url, timeout=self.timeout) as response:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
                 if response.status != 200:
                     return None
                 raw = response.read()
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+        except urllib.error.HTTPError as exc:
+            if exc.code == 304 and cached is not None:
+                return cached[2]
+            return None
         except (urllib.error.URLError, TimeoutError):
             return None
         try:
-            return json.loads(raw.decode("utf-8"))
-        except json.JSONDecodeError:
+            # orjson parses the UTF-8 bytes directly, without a decode to str first
+            payload = orjson.loads(raw)
+        except orjson.JSONDecodeError:
             return None
+        if isinstance(payload, dict) and (etag or last_modified):
+            self._http_cache[url] = (etag, last_modified, payload)
+        return payload
 
 
 def build_refresh_response(
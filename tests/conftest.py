@@ -3,8 +3,29 @@ from __future__ import annotations
 
 import os
 import sys
+from typing import Generator
+
+import pytest
+from flask import Flask
 
 # Ensure the application package is on sys.path when tests are executed from anywhere.
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
+
+from app import create_app  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def app() -> Flask:
+    # The services behind the routes are module-level singletons, so one app
+    # for the whole run shares exactly the state a per-test app would.
+    app = create_app()
+    app.config.update({"TESTING": True})
+    return app
+
+
+@pytest.fixture
+def client(app: Flask) -> Generator:
+    with app.test_client() as client:
+        yield client
@@ -1,41 +1,62 @@
 """API tests for the Generic vs. Branded Medicine Finder."""
 from __future__ import annotations
 
-import json
-from typing import Generator
+import time
 
 import pytest
 
-from app import create_app
-
+from app import api
+from app.api import search_medicines
+
+
+@pytest.mark.parametrize(
+    ("url", "cache_header"),
+    [
+        ("/", "Cache-Control"),
+        ("/api/medicines?q=lipitor", "Cache-Control"),
+        ("/api/medicines/Tylenol", "Last-Modified"),
+        ("/api/education/modules", "Cache-Control"),
+    ],
+)
+def test_supports_conditional_requests(client, url: str, cache_header: str) -> None:
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.headers[cache_header]
 
-@pytest.fixture
-def client() -> Generator:
-    app = create_app()
-    app.config.update({"TESTING": True})
-    with app.test_client() as client:
-        yield client
+    cached = client.get(url, headers={"If-None-Match": response.headers["ETag"]})
+    assert cached.status_code == 304
+    assert not cached.data
 
 
-def test_search_requires_minimum_query_length(client) -> None:
-    response = client.get("/api/medicines?q=a")
+def test_search_requires_minimum_query_length(app) -> None:
+    with app.test_request_context("/api/medicines?q=a"):
+        response = search_medicines()
     assert response.status_code == 400
-    payload = json.loads(response.data)
+    payload = response.get_json()
     assert "error" in payload
 
 
 def test_search_returns_results_for_known_brand(client) -> None:
     response = client.get("/api/medicines?q=tylenol")
     assert response.status_code == 200
-    payload = json.loads(response.data)
+    payload = response.get_json()
     assert payload["count"] >= 1
     assert any(result["generic_name"] == "Acetaminophen" for result in payload["results"])
 
 
+def test_search_includes_language_envelope(client) -> None:
+    response = client.get("/api/medicines?q=tylenol&lang=es")
+    assert response.status_code == 200
+    payload = response.get_json()
+    assert payload["language"] == "es"
+    assert payload["advice"].startswith("Siempre")
+    assert {lang["code"] for lang in payload["supported_languages"]} == {"en", "es", "hi"}
+
+
 def test_get_medicine_by_brand(client) -> None:
     response = client.get("/api/medicines/Tylenol")
     assert response.status_code == 200
-    payload = json.loads(response.data)
+    payload = response.get_json()
     assert payload["brand_name"] == "Tylenol"
     assert payload["generic_name"] == "Acetaminophen"
 
@@ -43,33 +64,91 @@ def test_get_medicine_by_brand(client) -> None:
 def test_get_medicine_by_brand_handles_unknown_brand(client) -> None:
     response = client.get("/api/medicines/UnknownBrand")
     assert response.status_code == 404
-    payload = json.loads(response.data)
+    payload = response.get_json()
     assert "error" in payload
 
 
 def test_pharmacy_offers_returned_for_known_brand(client) -> None:
     response = client.get("/api/medicines/Tylenol/pharmacies")
     assert response.status_code == 200
-    payload = json.loads(response.data)
+    payload = response.get_json()
     assert "offers" in payload
     assert payload["offers"]
     assert payload["offers"][0]["price"] >= 0
     assert "advice" in payload
 
 
+def test_pharmacy_offers_are_cheapest_first(client) -> None:
+    response = client.get("/api/medicines/Tylenol/pharmacies?locality=us-ny&limit=1")
+    assert response.status_code == 200
+    payload = response.get_json()
+    assert [offer["partner"] for offer in payload["offers"]] == ["Hudson Script"]
+
+
+def test_live_refresh_runs_in_background_and_updates_search(client, monkeypatch) -> None:
+    # Serve the "live" refresh from the packaged sample so the job is deterministic
+    fetch_dataset = api.regulatory_fetcher.fetch_dataset
+    monkeypatch.setattr(
+        api.regulatory_fetcher,
+        "fetch_dataset",
+        lambda *, limit=40, offline=False: fetch_dataset(limit=limit, offline=True),
+    )
+    # Prime the search cache before the merge
+    assert client.get("/api/medicines?q=xarelto").status_code == 200
+
+    response = client.post("/api/dataset/refresh", json={"limit": 40, "offline": False})
+    assert response.status_code == 202
+    job_id = response.get_json()["job_id"]
+
+    for _ in range(100):
+        status = client.get(f"/api/dataset/refresh/{job_id}").get_json()
+        if status["status"] != "pending":
+            break
+        time.sleep(0.05)
+    assert status["status"] == "completed"
+    assert "advice" in status
+
+    results = client.get("/api/medicines?q=xarelto").get_json()["results"]
+    assert "Xarelto" in {result["brand_name"] for result in results}
+
+
 def test_dataset_refresh_merges_sample(client) -> None:
     response = client.post("/api/dataset/refresh", json={"limit": 5, "offline": True})
     assert response.status_code == 200
-    payload = json.loads(response.data)
+    payload = response.get_json()
     assert payload["added"] >= 0
     assert "metadata" in payload
     assert "stats" in payload
 
 
+def test_dataset_refresh_ignores_non_json_body(client) -> None:
+    response = client.post(
+        "/api/dataset/refresh",
+        data='{"offline": true, "limit": 2}',
+        content_type="text/plain",
+    )
+    assert response.status_code == 200
+    assert response.get_json()["metadata"]["records"] == 5
+
+
+def test_dataset_refresh_falls_back_on_invalid_limit(client) -> None:
+    response = client.post("/api/dataset/refresh", json={"limit": "abc", "offline": True})
+    assert response.status_code == 200
+
+
+def test_refresh_status_unknown_job(client) -> None:
+    response = client.get("/api/dataset/refresh/does-not-exist")
+    assert response.status_code == 404
+    payload = response.get_json()
+    assert payload["job_id"] == "does-not-exist"
+    assert payload["error"]
+    assert "advice" in payload
+
+
 def test_education_modules_available(client) -> None:
     response = client.get("/api/education/modules")
     assert response.status_code == 200
-    payload = json.loads(response.data)
+    payload = response.get_json()
     assert payload["modules"]
     assert "advice" in payload
 
@@ -80,6 +159,17 @@ def test_savings_calculator_returns_totals(client) -> None:
         json={"medicine": "Metformin", "months": 6, "monthly_quantity": 1},
     )
     assert response.status_code == 200
-    payload = json.loads(response.data)
+    payload = response.get_json()
     assert payload["total_savings"] >= 0
     assert "advice" in payload
+
+
+def test_i18n_payload_is_cacheable(client) -> None:
+    response = client.get("/api/i18n?lang=hi")
+    assert response.status_code == 200
+    payload = response.get_json()
+    assert payload["metadata"]["language"] == "hi"
+    assert "hi" in payload["languages"]
+
+    cached = client.get("/api/i18n?lang=hi", headers={"If-None-Match": response.headers["ETag"]})
+    assert cached.status_code == 304
@@ -0,0 +1,112 @@
+"""Unit tests for the in-process caches used by the API layer."""
+from __future__ import annotations
+
+import threading
+import time
+
+from app.services import cache
+from app.services.cache import LRUCache, SingleFlight, TTLCache
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    lru: LRUCache[int] = LRUCache(maxsize=2)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    assert lru.get("a") == 1  # "b" is now the least recently used
+
+    lru.set("c", 3)
+    assert lru.get("b") is None
+    assert lru.get("a") == 1
+    assert lru.get("c") == 3
+    assert len(lru) == 2
+
+
+def test_ttl_cache_expires_entries(monkeypatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    ttl: TTLCache[str] = TTLCache(maxsize=4, ttl=10)
+    ttl.set("key", "value")
+
+    now[0] = 109.0
+    assert ttl.get("key") == "value"
+    now[0] = 111.0
+    assert ttl.get("key") is None
+
+
+def _run_concurrently(flight: SingleFlight, fn, waiters: int = 3):
+    """Run ``fn`` through ``flight`` from a leader plus ``waiters`` that join while it runs."""
+    started = threading.Event()
+    release = threading.Event()
+    outcomes: list = []
+
+    def leader_fn():
+        started.set()
+        release.wait(5)
+        return fn()
+
+    def call(target):
+        try:
+            outcomes.append(("ok", flight.do("key", target)))
+        except Exception as exc:
+            outcomes.append(("error", exc))
+
+    threads = [threading.Thread(target=call, args=(leader_fn,))]
+    threads[0].start()
+    started.wait(5)
+    for _ in range(waiters):
+        thread = threading.Thread(target=call, args=(fn,))
+        thread.start()
+        threads.append(thread)
+    time.sleep(0.2)  # let the waiters block on the leader's future
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    return outcomes
+
+
+def test_single_flight_shares_one_result() -> None:
+    calls = []
+
+    def fn():
+        calls.append(1)
+        return object()
+
+    outcomes = _run_concurrently(SingleFlight(), fn)
+    assert len(calls) == 1
+    assert len(outcomes) == 4
+    assert len({id(value) for status, value in outcomes if status == "ok"}) == 1
+
+
+def test_single_flight_shares_one_exception() -> None:
+    calls = []
+
+    def fn():
+        calls.append(1)
+        raise ValueError("boom")
+
+    outcomes = _run_concurrently(SingleFlight(), fn)
+    assert len(calls) == 1
+    assert [status for status, _ in outcomes] == ["error"] * 4
+    assert len({id(exc) for _, exc in outcomes}) == 1
+
+
+def test_single_flight_waiter_falls_back_after_timeout() -> None:
+    flight: SingleFlight[str] = SingleFlight(timeout=0.05)
+    started = threading.Event()
+    release = threading.Event()
+    results = []
+
+    def slow():
+        started.set()
+        release.wait(5)
+        return "leader"
+
+    leader = threading.Thread(target=lambda: results.append(flight.do("key", slow)))
+    leader.start()
+    started.wait(5)
+    try:
+        assert flight.do("key", lambda: "waiter") == "waiter"
+    finally:
+        release.set()
+        leader.join(5)
+    assert results == ["leader"]
@@ -0,0 +1,80 @@
+"""Ranking tests for the medicine matcher."""
+from __future__ import annotations
+
+import re
+from difflib import SequenceMatcher
+from typing import Dict, List
+
+import pytest
+
+from app.services.matching import MedicineMatcher
+
+_PAIRS = [
+    ("Glucophage", "Metformin"),
+    ("Glumetza", "Metformin"),
+    ("Fortamet", "Metformin"),
+    ("Riomet", "Metformin ER"),
+    ("Lipitor", "Atorvastatin"),
+    ("Zocor", "Simvastatin"),
+    ("Crestor", "Rosuvastatin"),
+    ("Pravachol", "Pravastatin"),
+    ("Tylenol", "Acetaminophen"),
+    ("Panadol", "Acetaminophen"),
+    ("Advil", "Ibuprofen"),
+    ("Motrin", "Ibuprofen"),
+    ("Norvasc", "Amlodipine"),
+    ("Zestril", "Lisinopril"),
+    ("Prinivil", "Lisinopril"),
+]
+_ROWS = [{"brand_name": brand, "generic_name": generic} for brand, generic in _PAIRS]
+# A name long enough to switch off the substring fast path for the whole matcher
+_LONG_ROWS = _ROWS + [{"brand_name": "Compound " + "x" * 200, "generic_name": "Placebo"}]
+
+
+def _normalize(value: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", value.lower())
+
+
+def _score(query: str, target: str) -> float:
+    if not query or not target:
+        return 0.0
+    if query in target:
+        return 1.0
+    return round(SequenceMatcher(None, query, target).ratio(), 2)
+
+
+def _linear_search(rows: List[Dict[str, str]], query: str, limit: int) -> List[str]:
+    """The original full scan: score every row, stable sort, keep the top ``limit``."""
+    normalized = _normalize(query)
+    if len(normalized) < 2:
+        return []
+    scored = []
+    for row in rows:
+        score = max(_score(normalized, _normalize(row["brand_name"])), _score(normalized, _normalize(row["generic_name"])))
+        if score:
+            scored.append((score, row["brand_name"]))
+    scored.sort(key=lambda item: item[0], reverse=True)
+    return [brand for _, brand in scored[:limit]]
+
+
+@pytest.mark.parametrize("rows", [_ROWS, _LONG_ROWS], ids=["fast-path", "full-scan"])
+@pytest.mark.parametrize(
+    ("query", "limit"),
+    [
+        ("metformin", 2),  # more substring hits than the limit
+        ("metformin", 10),  # substring hits then fuzzy fill
+        ("statin", 3),
+        ("acetaminophen", 1),  # tied substring hits keep dataset order
+        ("pril", 10),
+        ("lipitr", 5),  # fuzzy only
+        ("ibuprofn", 3),
+        ("zocr", 1),
+        ("Ator-Vastatin", 4),  # normalized before matching
+        ("qq", 10),
+        ("x", 10),  # too short to match
+    ],
+)
+def test_search_matches_linear_scan(rows: List[Dict[str, str]], query: str, limit: int) -> None:
+    matcher = MedicineMatcher(rows)
+    results = [result["brand_name"] for result in matcher.search(query, limit=limit)]
+    assert results == _linear_search(rows, query, limit)